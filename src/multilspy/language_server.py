@@ -6,12 +6,14 @@ The details of Language Specific configuration are not exposed to the user.
 """
 
 import asyncio
+import copy
 import dataclasses
 import json
 import time
 import logging
 import os
 import pathlib
+import sys
 import threading
 from contextlib import asynccontextmanager, contextmanager
 from .lsp_protocol_handler.lsp_constants import LSPConstants
@@ -27,7 +29,7 @@ from .multilspy_config import MultilspyConfig, Language
 from .multilspy_exceptions import MultilspyException
 from .multilspy_utils import PathUtils, FileUtils, TextUtils
 from pathlib import PurePath
-from typing import AsyncIterator, Iterator, List, Dict, Union, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Dict, Union, Tuple
 from .type_helpers import ensure_all_methods_implemented
 
 
@@ -195,8 +197,6 @@ class LanguageServer:
             assert self.open_file_buffers[uri].ref_count >= 1
 
             self.open_file_buffers[uri].ref_count += 1
-            yield
-            self.open_file_buffers[uri].ref_count -= 1
         else:
             contents = FileUtils.read_file(self.logger, absolute_file_path)
 
@@ -213,18 +213,22 @@ class LanguageServer:
                     }
                 }
             )
+
+        # The file is released even if the body raises, so that an edited buffer never outlives its scope
+        try:
             yield
+        finally:
             self.open_file_buffers[uri].ref_count -= 1
 
-        if self.open_file_buffers[uri].ref_count == 0:
-            self.server.notify.did_close_text_document(
-                {
-                    LSPConstants.TEXT_DOCUMENT: {
-                        LSPConstants.URI: uri,
+            if self.open_file_buffers[uri].ref_count == 0:
+                self.server.notify.did_close_text_document(
+                    {
+                        LSPConstants.TEXT_DOCUMENT: {
+                            LSPConstants.URI: uri,
+                        }
                     }
-                }
-            )
-            del self.open_file_buffers[uri]
+                )
+                del self.open_file_buffers[uri]
 
     def insert_text_at_position(
         self, relative_file_path: str, line: int, column: int, text_to_be_inserted: str
@@ -641,6 +645,24 @@ class LanguageServer:
 
         return multilspy_types.Hover(**response)
 
+    async def request_batch(self, requests: List[Tuple[str, Tuple]]) -> List[Any]:
+        """
+        Raise several requests to the Language Server without waiting for the response to one request before sending
+        the next, so that the Language Server can process them concurrently. Wait for all the responses and return the results.
+
+        :param requests: The requests to raise. Each request is given as the name of one of the request_* methods without
+            the "request_" prefix, like "definition" or "references", and the tuple of arguments to call it with.
+
+        :return List[Any]: The results of the requests, in the order of the requests
+        """
+        request_methods = []
+        for name, args in requests:
+            if name == "batch" or not callable(getattr(self, f"request_{name}", None)):
+                raise MultilspyException(f"Unknown request '{name}'")
+            request_methods.append((getattr(self, f"request_{name}"), args))
+
+        return list(await asyncio.gather(*[request_method(*args) for request_method, args in request_methods]))
+
 @ensure_all_methods_implemented(LanguageServer)
 class SyncLanguageServer:
     """
@@ -648,14 +670,17 @@ class SyncLanguageServer:
     It is used to communicate with Language Servers of different programming languages.
     """
 
-    def __init__(self, language_server: LanguageServer) -> None:
+    def __init__(self, language_server: LanguageServer, cache_responses: bool = False) -> None:
         self.language_server = language_server
         self.loop = None
         self.loop_thread = None
+        self.cache_responses = cache_responses
+        # Maps (request method, relative file path, *position) to the response of the Language Server
+        self.response_cache: Dict[Tuple, Any] = {}
 
     @classmethod
     def create(
-        cls, config: MultilspyConfig, logger: MultilspyLogger, repository_root_path: str
+        cls, config: MultilspyConfig, logger: MultilspyLogger, repository_root_path: str, cache_responses: bool = False
     ) -> "SyncLanguageServer":
         """
         Creates a language specific LanguageServer instance based on the given configuration, and appropriate settings for the programming language.
@@ -665,10 +690,40 @@ class SyncLanguageServer:
         :param repository_root_path: The root path of the repository.
         :param config: The Multilspy configuration.
         :param logger: The logger to use.
+        :param cache_responses: If True, the responses to definition, references, document symbols and hover requests
+            are cached until the next edit made through this instance. Edits to the files on disk are not tracked.
 
         :return SyncLanguageServer: A language specific LanguageServer instance.
         """
-        return SyncLanguageServer(LanguageServer.create(config, logger, repository_root_path))
+        return SyncLanguageServer(LanguageServer.create(config, logger, repository_root_path), cache_responses)
+
+    def _run_cached_request(self, cache_key: Tuple, make_request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs the request created by make_request on the event loop of the Language Server and returns its response.
+        If responses are cached, a copy of the cached response for cache_key is returned instead when available.
+        """
+        if not self.cache_responses:
+            return asyncio.run_coroutine_threadsafe(make_request(), self.loop).result()
+
+        if cache_key not in self.response_cache:
+            self.response_cache[cache_key] = asyncio.run_coroutine_threadsafe(make_request(), self.loop).result()
+        # Callers are free to modify the returned response, so the cached one is never handed out
+        return copy.deepcopy(self.response_cache[cache_key])
+
+    def _call_on_loop(self, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Calls function with args on the event loop thread of the Language Server and returns its result. The
+        notifications are written to the pipe of the server process, which may only be used from that thread.
+        Outside start_server there is no event loop thread, so function is called directly and raises that the
+        Language Server is not started.
+        """
+        if self.loop_thread is None:
+            return function(*args)
+
+        async def call() -> Any:
+            return function(*args)
+
+        return asyncio.run_coroutine_threadsafe(call(), self.loop).result()
 
     @contextmanager
     def open_file(self, relative_file_path: str) -> Iterator[None]:
@@ -677,8 +732,18 @@ class SyncLanguageServer:
 
         :param relative_file_path: The relative path of the file to open.
         """
-        with self.language_server.open_file(relative_file_path):
+        file_context = self.language_server.open_file(relative_file_path)
+        self._call_on_loop(file_context.__enter__)
+        try:
             yield
+        except BaseException:
+            if not self._call_on_loop(file_context.__exit__, *sys.exc_info()):
+                raise
+        else:
+            self._call_on_loop(file_context.__exit__, None, None, None)
+        finally:
+            # Closing a file drops its edited buffer, so the responses computed against the edits are stale
+            self.response_cache.clear()
 
     def insert_text_at_position(
         self, relative_file_path: str, line: int, column: int, text_to_be_inserted: str
@@ -692,7 +757,11 @@ class SyncLanguageServer:
         :param column: The column number at which text should be inserted.
         :param text_to_be_inserted: The text to insert.
         """
-        return self.language_server.insert_text_at_position(relative_file_path, line, column, text_to_be_inserted)
+        # An edit can change the response to any request, not only those about the edited file
+        self.response_cache.clear()
+        return self._call_on_loop(
+            self.language_server.insert_text_at_position, relative_file_path, line, column, text_to_be_inserted
+        )
 
     def delete_text_between_positions(
         self,
@@ -703,7 +772,8 @@ class SyncLanguageServer:
         """
         Delete text between the given start and end positions in the given file and return the deleted text.
         """
-        return self.language_server.delete_text_between_positions(relative_file_path, start, end)
+        self.response_cache.clear()
+        return self._call_on_loop(self.language_server.delete_text_between_positions, relative_file_path, start, end)
 
     def get_open_file_text(self, relative_file_path: str) -> str:
         """
@@ -720,15 +790,19 @@ class SyncLanguageServer:
 
         :return: None
         """
+        self.response_cache.clear()
         self.loop = asyncio.new_event_loop()
-        loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
-        loop_thread.start()
+        # All the requests made while the server is running are executed on this one thread
+        self.loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.loop_thread.start()
         ctx = self.language_server.start_server()
         asyncio.run_coroutine_threadsafe(ctx.__aenter__(), loop=self.loop).result()
         yield self
         asyncio.run_coroutine_threadsafe(ctx.__aexit__(None, None, None), loop=self.loop).result()
         self.loop.call_soon_threadsafe(self.loop.stop)
-        loop_thread.join()
+        self.loop_thread.join()
+        self.loop_thread = None
+        self.loop = None
 
     def request_definition(self, file_path: str, line: int, column: int) -> List[multilspy_types.Location]:
         """
@@ -741,10 +815,10 @@ class SyncLanguageServer:
 
         :return List[multilspy_types.Location]: A list of locations where the symbol is defined
         """
-        result = asyncio.run_coroutine_threadsafe(
-            self.language_server.request_definition(file_path, line, column), self.loop
-        ).result()
-        return result
+        return self._run_cached_request(
+            ("definition", file_path, line, column),
+            lambda: self.language_server.request_definition(file_path, line, column),
+        )
 
     def request_references(self, file_path: str, line: int, column: int) -> List[multilspy_types.Location]:
         """
@@ -757,10 +831,10 @@ class SyncLanguageServer:
 
         :return List[multilspy_types.Location]: A list of locations where the symbol is referenced
         """
-        result = asyncio.run_coroutine_threadsafe(
-            self.language_server.request_references(file_path, line, column), self.loop
-        ).result()
-        return result
+        return self._run_cached_request(
+            ("references", file_path, line, column),
+            lambda: self.language_server.request_references(file_path, line, column),
+        )
 
     def request_completions(
         self, relative_file_path: str, line: int, column: int, allow_incomplete: bool = False
@@ -790,10 +864,10 @@ class SyncLanguageServer:
 
         :return Tuple[List[multilspy_types.UnifiedSymbolInformation], Union[List[multilspy_types.TreeRepr], None]]: A list of symbols in the file, and the tree representation of the symbols
         """
-        result = asyncio.run_coroutine_threadsafe(
-            self.language_server.request_document_symbols(relative_file_path), self.loop
-        ).result()
-        return result
+        return self._run_cached_request(
+            ("documentSymbol", relative_file_path),
+            lambda: self.language_server.request_document_symbols(relative_file_path),
+        )
 
     def request_hover(self, relative_file_path: str, line: int, column: int) -> Union[multilspy_types.Hover, None]:
         """
@@ -806,7 +880,23 @@ class SyncLanguageServer:
 
         :return None
         """
+        return self._run_cached_request(
+            ("hover", relative_file_path, line, column),
+            lambda: self.language_server.request_hover(relative_file_path, line, column),
+        )
+
+    def request_batch(self, requests: List[Tuple[str, Tuple]]) -> List[Any]:
+        """
+        Raise several requests to the Language Server without waiting for the response to one request before sending
+        the next, so that the Language Server can process them concurrently. Wait for all the responses and return the results.
+        The responses to batched requests are not cached.
+
+        :param requests: The requests to raise. Each request is given as the name of one of the request_* methods without
+            the "request_" prefix, like "definition" or "references", and the tuple of arguments to call it with.
+
+        :return List[Any]: The results of the requests, in the order of the requests
+        """
         result = asyncio.run_coroutine_threadsafe(
-            self.language_server.request_hover(relative_file_path, line, column), self.loop
+            self.language_server.request_batch(requests), self.loop
         ).result()
         return result
@@ -31,11 +31,14 @@ class TypeScriptLanguageServer(LanguageServer):
         Creates a TypeScriptLanguageServer instance. This class is not meant to be instantiated directly. Use LanguageServer.create() instead.
         """
         ts_lsp_executable_path = self.setup_runtime_dependencies(logger, config)
+        # tsserver reads the project files synchronously, so it needs few libuv worker threads. A smaller pool
+        # contends less with the client on busy machines, and an explicit UV_THREADPOOL_SIZE is still respected.
+        proc_env = {"UV_THREADPOOL_SIZE": os.environ.get("UV_THREADPOOL_SIZE", "2")}
         super().__init__(
             config,
             logger,
             repository_root_path,
-            ProcessLaunchInfo(cmd=ts_lsp_executable_path, cwd=repository_root_path),
+            ProcessLaunchInfo(cmd=ts_lsp_executable_path, env=proc_env, cwd=repository_root_path),
             "typescript",
         )
         self.server_ready = asyncio.Event()
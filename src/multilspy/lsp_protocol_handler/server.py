@@ -37,6 +37,13 @@ from typing import Any, Dict, List, Optional, Union
 from .lsp_requests import LspNotification, LspRequest
 from .lsp_types import ErrorCodes
 
+try:
+    # orjson is optional. When it is installed, it encodes the requests and parses the (often large) responses of the
+    # server several times faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
 StringDict = Dict[str, Any]
 PayloadLike = Union[List[StringDict], StringDict, None]
 CONTENT_LENGTH = "Content-Length: "
@@ -95,13 +102,39 @@ class StopLoopException(Exception):
     pass
 
 
-def create_message(payload: PayloadLike):
-    body = json.dumps(payload, check_circular=False, ensure_ascii=False, separators=(",", ":")).encode(ENCODING)
-    return (
-        f"Content-Length: {len(body)}\r\n".encode(ENCODING),
-        "Content-Type: application/vscode-jsonrpc; charset=utf-8\r\n\r\n".encode(ENCODING),
-        body,
-    )
+def _json_loads(body: bytes) -> Any:
+    """
+    Parse the UTF-8 encoded JSON body of a message
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # orjson rejects a few documents that json accepts, like strings with a lone surrogate escape, which the
+            # servers written in JavaScript can send after cutting a string in the middle of a surrogate pair
+            pass
+    return json.loads(body)
+
+
+def _json_dumps(payload: PayloadLike) -> bytes:
+    """
+    Serialize the payload to compact UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            # orjson rejects a few payloads that json accepts, like dictionaries with non-str keys
+            pass
+    return json.dumps(payload, check_circular=False, ensure_ascii=False, separators=(",", ":")).encode(ENCODING)
+
+
+def create_message(payload: PayloadLike) -> bytes:
+    """
+    Frame the payload as a single buffer holding the headers and the body, so that it is written to the pipe at once
+    """
+    body = _json_dumps(payload)
+    return b"Content-Length: %d\r\nContent-Type: application/vscode-jsonrpc; charset=utf-8\r\n\r\n%b" % (len(body), body)
 
 
 class MessageType:
@@ -307,7 +340,7 @@ class LanguageServerHandler:
         Parse the body text received from the language server process and invoke the appropriate handler
         """
         try:
-            await self._receive_payload(json.loads(body))
+            await self._receive_payload(_json_loads(body))
         except IOError as ex:
             self._log(f"malformed {ENCODING}: {ex}")
         except UnicodeDecodeError as ex:
@@ -382,7 +415,7 @@ class LanguageServerHandler:
         msg = create_message(payload)
         if self.logger:
             self.logger("client", "server", payload)
-        self.process.stdin.writelines(msg)
+        self.process.stdin.write(msg)
 
     async def _send_payload(self, payload: StringDict) -> None:
         """
@@ -393,7 +426,7 @@ class LanguageServerHandler:
         msg = create_message(payload)
         if self.logger:
             self.logger("client", "server", payload)
-        self.process.stdin.writelines(msg)
+        self.process.stdin.write(msg)
         await self.process.stdin.drain()
 
     def on_request(self, method: str, cb) -> None:
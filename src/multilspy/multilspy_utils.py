@@ -9,6 +9,7 @@ from typing import Tuple
 import requests
 import shutil
 import uuid
+from requests.adapters import HTTPAdapter, Retry
 
 import platform
 import subprocess
@@ -18,6 +19,19 @@ from multilspy.multilspy_exceptions import MultilspyException
 from pathlib import PurePath, Path
 from multilspy.multilspy_logger import MultilspyLogger
 
+def _create_download_session() -> requests.Session:
+    """
+    Creates the HTTP session shared by all downloads, so that connections to a host are reused across downloads, and
+    transient failures are retried.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504]))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+_download_session = _create_download_session()
+
 class TextUtils:
     """
     Utilities for text operations.
@@ -119,12 +133,13 @@ class FileUtils:
         Downloads the file from the given URL to the given {target_path}
         """
         try:
-            response = requests.get(url, stream=True, timeout=60)
-            if response.status_code != 200:
-                logger.log(f"Error downloading file '{url}': {response.status_code} {response.text}", logging.ERROR)
-                raise MultilspyException("Error downoading file.")
-            with open(target_path, "wb") as f:
-                shutil.copyfileobj(response.raw, f)
+            # The response is closed once read, which returns its connection to the session for the next download
+            with _download_session.get(url, stream=True, timeout=60) as response:
+                if response.status_code != 200:
+                    logger.log(f"Error downloading file '{url}': {response.status_code} {response.text}", logging.ERROR)
+                    raise MultilspyException("Error downoading file.")
+                with open(target_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f)
         except Exception as exc:
             logger.log(f"Error downloading file '{url}': {exc}", logging.ERROR)
             raise MultilspyException("Error downoading file.") from None
@@ -0,0 +1,23 @@
+"""
+This file contains the pytest fixtures shared by the multilspy tests
+"""
+
+import pytest
+from typing import Iterator
+from multilspy import SyncLanguageServer
+from tests.test_utils import create_test_context
+from tests.multilspy.multilspy_repositories import TRPC_PARAMS
+
+@pytest.fixture(scope="session")
+def trpc_lsp() -> Iterator[SyncLanguageServer]:
+    """
+    Starts one typescript-language-server instance on the trpc repository, which is shared by all the tests of the
+    session that use it. The tests must not edit the files.
+    """
+    with create_test_context(TRPC_PARAMS) as context:
+        lsp = SyncLanguageServer.create(context.config, context.logger, context.source_directory)
+
+        # All the communication with the language server must be performed inside the context manager
+        # The server process is started when the context manager is entered and is terminated when the context manager is exited.
+        with lsp.start_server():
+            yield lsp
@@ -0,0 +1,13 @@
+"""
+Provides the parameters shared by the tests that run on the same test repository.
+"""
+
+from multilspy.multilspy_config import Language
+
+# The whole repository is extracted: the expected results of the trpc tests were recorded on a full checkout, and have
+# not been checked against one limited with sparse_paths, in which tsserver may resolve imports differently.
+TRPC_PARAMS = {
+    "code_language": Language.TYPESCRIPT,
+    "repo_url": "https://github.com/trpc/trpc/",
+    "repo_commit": "936db6dd2598337758e29c843ff66984ed54faaf",
+}
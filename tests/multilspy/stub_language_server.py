@@ -0,0 +1,67 @@
+"""
+Provides the StubLanguageServer class, which stands in for a LanguageServer in the tests of SyncLanguageServer.
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, List, Set
+from multilspy import LanguageServer
+from multilspy.multilspy_exceptions import MultilspyException
+from multilspy.multilspy_types import Position
+
+class StubLanguageServer:
+    """
+    Stands in for a LanguageServer without starting a language server process. Every response records how many
+    requests the stub had served, so that a cached response can be told apart from a fresh one. The threads that
+    would have written notifications and requests to the server process are recorded in notification_threads and
+    request_threads. request_batch is the one of LanguageServer, dispatching to the requests of the stub. Like a
+    LanguageServer, the stub raises on file operations made while it is not started.
+    """
+
+    def __init__(self) -> None:
+        self.server_started = False
+        self.request_count = 0
+        self.notification_threads: Set[int] = set()
+        self.request_threads: Set[int] = set()
+
+    @asynccontextmanager
+    async def start_server(self) -> AsyncIterator["StubLanguageServer"]:
+        self.server_started = True
+        yield self
+        self.server_started = False
+
+    def _record_notification(self) -> None:
+        if not self.server_started:
+            raise MultilspyException("Language Server not started")
+        self.notification_threads.add(threading.get_ident())
+
+    @contextmanager
+    def open_file(self, relative_file_path: str) -> Iterator[None]:
+        self._record_notification()
+        try:
+            yield
+        finally:
+            self.notification_threads.add(threading.get_ident())
+
+    def insert_text_at_position(self, relative_file_path: str, line: int, column: int, text_to_be_inserted: str) -> Position:
+        self._record_notification()
+        return Position(line=line, character=column + len(text_to_be_inserted))
+
+    def delete_text_between_positions(self, relative_file_path: str, start: Position, end: Position) -> str:
+        self._record_notification()
+        return ""
+
+    async def request_definition(self, relative_file_path: str, line: int, column: int) -> List[dict]:
+        self.request_count += 1
+        self.request_threads.add(threading.get_ident())
+        return [{"relativePath": relative_file_path, "line": line, "column": column, "request": self.request_count}]
+
+    async def request_references(self, relative_file_path: str, line: int, column: int) -> List[dict]:
+        # The response is delayed, so that it arrives after those of the requests sent along with it
+        await asyncio.sleep(0.01)
+        self.request_count += 1
+        self.request_threads.add(threading.get_ident())
+        return [{"relativePath": relative_file_path, "line": line, "column": column, "request": self.request_count}]
+
+    request_batch = LanguageServer.request_batch
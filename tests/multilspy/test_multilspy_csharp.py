@@ -2,15 +2,21 @@
 This file contains tests for running the C# Language Server: OmniSharp
 """
 
+import asyncio
 import pytest
 
 from multilspy import LanguageServer
 from multilspy.multilspy_config import Language
 from multilspy.multilspy_types import Position, CompletionItemKind
-from tests.test_utils import create_test_context
+from tests.test_utils import create_async_test_context, project_locations
 from pathlib import PurePath
 
+_AUDIO_INPUT_MANAGER_CS = str(PurePath("src/Ryujinx.Audio/Input/AudioInputManager.cs"))
+_CONSTANTS_CS = str(PurePath("src/Ryujinx.Audio/Constants.cs"))
+_AUDIO_INPUT_SYSTEM_CS = str(PurePath("src/Ryujinx.Audio/Input/AudioInputSystem.cs"))
+
 pytest_plugins = ("pytest_asyncio",)
+pytestmark = pytest.mark.xdist_group(name="csharp")
 
 
 @pytest.mark.asyncio
@@ -24,43 +30,40 @@ async def test_multilspy_csharp_ryujinx():
         "repo_url": "https://github.com/LakshyAAAgrawal/Ryujinx/",
         "repo_commit": "e768a54f17b390c3ac10904c7909e3bef020edbd"
     }
-    with create_test_context(params) as context:
+    async with create_async_test_context(params) as context:
         lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
 
         # All the communication with the language server must be performed inside the context manager
         # The server process is started when the context manager is entered and is terminated when the context manager is exited.
         # The context manager is an asynchronous context manager, so it must be used with async with.
         async with lsp.start_server():
-            result = await lsp.request_definition(str(PurePath("src/Ryujinx.Audio/Input/AudioInputManager.cs")), 176, 44)
-
-            assert isinstance(result, list)
-            assert len(result) == 1
-            item = result[0]
-            assert item["relativePath"] == str(PurePath("src/Ryujinx.Audio/Constants.cs"))
+            definition_result, references_result = await asyncio.gather(
+                lsp.request_definition(_AUDIO_INPUT_MANAGER_CS, 176, 44),
+                lsp.request_references(_CONSTANTS_CS, 15, 40),
+            )
+
+            assert isinstance(definition_result, list)
+            assert len(definition_result) == 1
+            item = definition_result[0]
+            assert item["relativePath"] == _CONSTANTS_CS
             assert item["range"] == {
                 "start": {"line": 15, "character": 28},
                 "end": {"line": 15, "character": 50},
             }
 
-            result = await lsp.request_references(str(PurePath("src/Ryujinx.Audio/Constants.cs")), 15, 40)
-
-            assert isinstance(result, list)
-            assert len(result) == 2
-
-            for item in result:
-                del item["uri"]
-                del item["absolutePath"]
+            assert isinstance(references_result, list)
+            assert len(references_result) == 2
 
-            assert result == [
+            assert project_locations(references_result) == [
                 {
-                    "relativePath": str(PurePath("src/Ryujinx.Audio/Input/AudioInputManager.cs")),
+                    "relativePath": _AUDIO_INPUT_MANAGER_CS,
                     "range": {
                         "start": {"line": 176, "character": 37},
                         "end": {"line": 176, "character": 59},
                     },
                 },
                 {
-                    "relativePath": str(PurePath("src/Ryujinx.Audio/Input/AudioInputSystem.cs")),
+                    "relativePath": _AUDIO_INPUT_SYSTEM_CS,
                     "range": {
                         "start": {"line": 77, "character": 29},
                         "end": {"line": 77, "character": 51},
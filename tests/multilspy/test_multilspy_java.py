@@ -2,14 +2,80 @@
 This file contains tests for running the Java Language Server: Eclipse JDT.LS
 """
 
+import asyncio
 import pytest
+import pytest_asyncio
 from pathlib import PurePath
+from typing import AsyncIterator, Iterator, Union
 from multilspy import LanguageServer
 from multilspy.multilspy_config import Language
 from multilspy.multilspy_types import Position, CompletionItemKind
-from tests.test_utils import create_test_context
+from tests.test_utils import create_async_test_context, load_test_fixture, project_locations
+
+_CLICKHOUSE_SINK_MANAGER_JAVA = str(PurePath("src/main/java/com/xlvchao/clickhouse/component/ClickHouseSinkManager.java"))
+_SCHEDULED_CHECKER_AND_CLEANER_JAVA = str(PurePath("src/main/java/com/xlvchao/clickhouse/component/ScheduledCheckerAndCleaner.java"))
+_CLICKHOUSE_DATA_SOURCE_JAVA = str(PurePath("src/main/java/com/xlvchao/clickhouse/datasource/ClickHouseDataSource.java"))
+_CLICKHOUSE_SINK_BUFFER_JAVA = str(PurePath("src/main/java/com/xlvchao/clickhouse/component/ClickHouseSinkBuffer.java"))
+_PERSON_JAVA = str(PurePath("Person.java"))
+_STUDENT_JAVA = str(PurePath("Student.java"))
 
 pytest_plugins = ("pytest_asyncio",)
+pytestmark = pytest.mark.xdist_group(name="java")
+
+def _symbol_key(symbol: dict) -> tuple:
+    """
+    Flattens a document symbol into a tuple of its name, kind, detail, range and selection range
+    """
+    return (
+        symbol["name"],
+        symbol["kind"],
+        symbol.get("detail"),
+        symbol["range"]["start"]["line"],
+        symbol["range"]["start"]["character"],
+        symbol["range"]["end"]["line"],
+        symbol["range"]["end"]["character"],
+        symbol["selectionRange"]["start"]["line"],
+        symbol["selectionRange"]["start"]["character"],
+        symbol["selectionRange"]["end"]["line"],
+        symbol["selectionRange"]["end"]["character"],
+    )
+
+_EXPECTED_EXAMPLE_REPO_SYMBOLS = {
+    file_name: tuple(map(_symbol_key, symbols))
+    for file_name, symbols in load_test_fixture("java_example_repo_document_symbols").items()
+}
+
+@pytest.fixture(scope="module")
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """
+    Runs all the tests in this module on one event loop, so that they can share a module-scoped language server.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="module")
+async def clickhouse_sinker_modified_lsp() -> AsyncIterator[LanguageServer]:
+    """
+    Starts one Eclipse JDT.LS instance on the modified clickhouse-highlevel-sinker repository, which is shared by all
+    the tests in this module that use it. Tests edit the files only within their own open_file scope, which closes
+    the file even when an assertion fails, so that the buffers are restored before the next test runs.
+    """
+    params = {
+        "code_language": Language.JAVA,
+        "repo_url": "https://github.com/LakshyAAAgrawal/clickhouse-highlevel-sinker/",
+        "repo_commit": "5775fd7a67e7b60998e1614cf44a8a1fc3190ab0"
+    }
+    async with create_async_test_context(params) as context:
+        lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
+
+        # All the communication with the language server must be performed inside the context manager
+        # The server process is started when the context manager is entered and is terminated when the context manager is exited.
+        async with lsp.start_server():
+            # JDT.LS builds a file and its dependencies on the first request about it, so that cost is paid here
+            # rather than by whichever test happens to run first
+            await lsp.request_document_symbols(_CLICKHOUSE_DATA_SOURCE_JAVA)
+            yield lsp
 
 @pytest.mark.asyncio
 async def test_multilspy_java_clickhouse_highlevel_sinker():
@@ -22,79 +88,72 @@ async def test_multilspy_java_clickhouse_highlevel_sinker():
         "repo_url": "https://github.com/Index103000/clickhouse-highlevel-sinker/",
         "repo_commit": "ee31d278918fe5e64669a6840c4d8fb53889e573"
     }
-    with create_test_context(params) as context:
+    async with create_async_test_context(params) as context:
         lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
 
         # All the communication with the language server must be performed inside the context manager
         # The server process is started when the context manager is entered and is terminated when the context manager is exited.
         # The context manager is an asynchronous context manager, so it must be used with async with.
         async with lsp.start_server():
-            filepath = str(PurePath("src/main/java/com/xlvchao/clickhouse/component/ClickHouseSinkManager.java"))
-            result = await lsp.request_definition(filepath, 44, 59)
+            filepath = _CLICKHOUSE_SINK_MANAGER_JAVA
+            with lsp.open_file(filepath):
+                result = await lsp.request_definition(filepath, 44, 59)
 
-            assert isinstance(result, list)
-            assert len(result) == 1
-            item = result[0]
-            assert item["relativePath"] == str(
-                PurePath("src/main/java/com/xlvchao/clickhouse/component/ScheduledCheckerAndCleaner.java")
-            )
-            assert item["range"] == {
-                "start": {"line": 22, "character": 11},
-                "end": {"line": 22, "character": 37},
-            }
+                assert isinstance(result, list)
+                assert len(result) == 1
+                item = result[0]
+                assert item["relativePath"] == _SCHEDULED_CHECKER_AND_CLEANER_JAVA
+                assert item["range"] == {
+                    "start": {"line": 22, "character": 11},
+                    "end": {"line": 22, "character": 37},
+                }
 
-            # TODO: The following test is running flaky on Windows. Investigate and fix.
-            # On Windows, it returns the correct result sometimes and sometimes it returns the following:
-            # incorrect_output = [
-            #     {
-            #         "range": {"end": {"character": 86, "line": 24}, "start": {"character": 65, "line": 24}},
-            #         "relativePath": "src\\main\\java\\com\\xlvchao\\clickhouse\\component\\ClickHouseSinkManager.java",
-            #     },
-            #     {
-            #         "range": {"end": {"character": 61, "line": 2}, "start": {"character": 7, "line": 2}},
-            #         "relativePath": "src\\test\\java\\com\\xlvchao\\clickhouse\\SpringbootDemo.java",
-            #     },
-            #     {
-            #         "range": {"end": {"character": 29, "line": 28}, "start": {"character": 8, "line": 28}},
-            #         "relativePath": "src\\test\\java\\com\\xlvchao\\clickhouse\\SpringbootDemo.java",
-            #     },
-            #     {
-            #         "range": {"end": {"character": 69, "line": 28}, "start": {"character": 48, "line": 28}},
-            #         "relativePath": "src\\test\\java\\com\\xlvchao\\clickhouse\\SpringbootDemo.java",
-            #     },
-            # ]
+                # TODO: The following test is running flaky on Windows. Investigate and fix.
+                # On Windows, it returns the correct result sometimes and sometimes it returns the following:
+                # incorrect_output = [
+                #     {
+                #         "range": {"end": {"character": 86, "line": 24}, "start": {"character": 65, "line": 24}},
+                #         "relativePath": "src\\main\\java\\com\\xlvchao\\clickhouse\\component\\ClickHouseSinkManager.java",
+                #     },
+                #     {
+                #         "range": {"end": {"character": 61, "line": 2}, "start": {"character": 7, "line": 2}},
+                #         "relativePath": "src\\test\\java\\com\\xlvchao\\clickhouse\\SpringbootDemo.java",
+                #     },
+                #     {
+                #         "range": {"end": {"character": 29, "line": 28}, "start": {"character": 8, "line": 28}},
+                #         "relativePath": "src\\test\\java\\com\\xlvchao\\clickhouse\\SpringbootDemo.java",
+                #     },
+                #     {
+                #         "range": {"end": {"character": 69, "line": 28}, "start": {"character": 48, "line": 28}},
+                #         "relativePath": "src\\test\\java\\com\\xlvchao\\clickhouse\\SpringbootDemo.java",
+                #     },
+                # ]
 
-            result = await lsp.request_references(filepath, 82, 27)
+                result = await lsp.request_references(filepath, 82, 27)
 
-            assert isinstance(result, list)
-            assert len(result) == 2
+                assert isinstance(result, list)
+                assert len(result) == 2
 
-            for item in result:
-                del item["uri"]
-                del item["absolutePath"]
+                result = project_locations(result)
 
-            assert result == [
-                {
-                    "relativePath": str(
-                        PurePath("src/main/java/com/xlvchao/clickhouse/component/ClickHouseSinkManager.java")
-                    ),
-                    "range": {
-                        "start": {"line": 75, "character": 66},
-                        "end": {"line": 75, "character": 85},
+                assert result == [
+                    {
+                        "relativePath": _CLICKHOUSE_SINK_MANAGER_JAVA,
+                        "range": {
+                            "start": {"line": 75, "character": 66},
+                            "end": {"line": 75, "character": 85},
+                        },
                     },
-                },
-                {
-                    "relativePath": str(
-                        PurePath("src/main/java/com/xlvchao/clickhouse/component/ClickHouseSinkManager.java")
-                    ),
-                    "range": {
-                        "start": {"line": 71, "character": 12},
-                        "end": {"line": 71, "character": 31},
+                    {
+                        "relativePath": _CLICKHOUSE_SINK_MANAGER_JAVA,
+                        "range": {
+                            "start": {"line": 71, "character": 12},
+                            "end": {"line": 71, "character": 31},
+                        },
                     },
-                },
-            ]
+                ]
 
-            completions_filepath = "src/main/java/com/xlvchao/clickhouse/datasource/ClickHouseDataSource.java"
+            completions_filepath = _CLICKHOUSE_DATA_SOURCE_JAVA
             with lsp.open_file(completions_filepath):
                 deleted_text = lsp.delete_text_between_positions(
                     completions_filepath,
@@ -124,7 +183,7 @@ async def test_multilspy_java_clickhouse_highlevel_sinker():
                 completions = [completion["completionText"] for completion in completions]
                 assert set(completions) == set(['build', 'equals', 'getClass', 'hashCode', 'toString', 'withIp', 'withPort', 'notify', 'notifyAll', 'wait', 'wait', 'wait', 'newServerNode'])
             
-            completions_filepath = "src/main/java/com/xlvchao/clickhouse/component/ClickHouseSinkBuffer.java"
+            completions_filepath = _CLICKHOUSE_SINK_BUFFER_JAVA
             with lsp.open_file(completions_filepath):
                 deleted_text = lsp.delete_text_between_positions(
                     completions_filepath,
@@ -144,68 +203,75 @@ async def test_multilspy_java_clickhouse_highlevel_sinker():
                 assert completions == ['ClickHouseSinkBuffer']
 
 @pytest.mark.asyncio
-async def test_multilspy_java_clickhouse_highlevel_sinker_modified():
-    """
-    Test the working of multilspy with Java repository - clickhouse-highlevel-sinker
-    """
-    code_language = Language.JAVA
-    params = {
-        "code_language": code_language,
-        "repo_url": "https://github.com/LakshyAAAgrawal/clickhouse-highlevel-sinker/",
-        "repo_commit": "5775fd7a67e7b60998e1614cf44a8a1fc3190ab0"
-    }
-    with create_test_context(params) as context:
-        lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
-        # All the communication with the language server must be performed inside the context manager
-        # The server process is started when the context manager is entered and is terminated when the context manager is exited.
-        # The context manager is an asynchronous context manager, so it must be used with async with.
-        async with lsp.start_server():
-            completions_filepath = "src/main/java/com/xlvchao/clickhouse/datasource/ClickHouseDataSource.java"
-            with lsp.open_file(completions_filepath):
-                deleted_text = lsp.delete_text_between_positions(
-                    completions_filepath,
-                    Position(line=74, character=17),
-                    Position(line=77, character=4)
-                )
-                assert deleted_text == """newServerNode()
+@pytest.mark.parametrize(
+    "completions_filepath, start, end, expected_deleted_text, completion_kind, expected_completions",
+    [
+        pytest.param(
+            _CLICKHOUSE_DATA_SOURCE_JAVA,
+            Position(line=74, character=17),
+            Position(line=77, character=4),
+            """newServerNode()
                 .withIpPort(arr[0], Integer.parseInt(arr[1]))
                 .build();
-    """
-                completions = await lsp.request_completions(completions_filepath, 74, 17)
-                completions = [completion["completionText"] for completion in completions]
-                assert set(completions) == set(['class', 'newServerNode'])
-
-            with lsp.open_file(completions_filepath):
-                deleted_text = lsp.delete_text_between_positions(
-                    completions_filepath,
-                    Position(line=75, character=17),
-                    Position(line=77, character=4)
-                )
-                assert deleted_text == """withIpPort(arr[0], Integer.parseInt(arr[1]))
+    """,
+            None,
+            set(['class', 'newServerNode']),
+            id="static_member",
+        ),
+        pytest.param(
+            _CLICKHOUSE_DATA_SOURCE_JAVA,
+            Position(line=75, character=17),
+            Position(line=77, character=4),
+            """withIpPort(arr[0], Integer.parseInt(arr[1]))
                 .build();
-    """
-                completions = await lsp.request_completions(completions_filepath, 75, 17)
-                completions = [completion["completionText"] for completion in completions]
-                assert set(completions) == set(['build', 'equals', 'getClass', 'hashCode', 'toString', 'withIpPort', 'notify', 'notifyAll', 'wait', 'wait', 'wait', 'newServerNode'])
-
-            completions_filepath = "src/main/java/com/xlvchao/clickhouse/component/ClickHouseSinkBuffer.java"
-            with lsp.open_file(completions_filepath):
-                deleted_text = lsp.delete_text_between_positions(
-                    completions_filepath,
-                    Position(line=136, character=23),
-                    Position(line=143, character=8)
-                )
-                assert deleted_text == """ClickHouseSinkBuffer(
+    """,
+            None,
+            set(['build', 'equals', 'getClass', 'hashCode', 'toString', 'withIpPort', 'notify', 'notifyAll', 'wait', 'wait', 'wait', 'newServerNode']),
+            id="instance_member",
+        ),
+        pytest.param(
+            _CLICKHOUSE_SINK_BUFFER_JAVA,
+            Position(line=136, character=23),
+            Position(line=143, character=8),
+            """ClickHouseSinkBuffer(
                     this.writer,
                     this.writeTimeout,
                     this.batchSize,
                     this.clazz,
                     this.futures
             );
-        """
-                completions = await lsp.request_completions(completions_filepath, 136, 23)
-                completions = [completion["completionText"] for completion in completions if completion["kind"] == CompletionItemKind.Constructor]
-                assert completions == ['ClickHouseSinkBuffer']
+        """,
+            CompletionItemKind.Constructor,
+            ['ClickHouseSinkBuffer'],
+            id="constructor",
+        ),
+    ],
+)
+async def test_multilspy_java_clickhouse_highlevel_sinker_modified(
+    clickhouse_sinker_modified_lsp: LanguageServer,
+    completions_filepath: str,
+    start: Position,
+    end: Position,
+    expected_deleted_text: str,
+    completion_kind: Union[CompletionItemKind, None],
+    expected_completions: Union[set, list],
+):
+    """
+    Test the working of multilspy with Java repository - clickhouse-highlevel-sinker
+    """
+    lsp = clickhouse_sinker_modified_lsp
+    with lsp.open_file(completions_filepath):
+        deleted_text = lsp.delete_text_between_positions(completions_filepath, start, end)
+        assert deleted_text == expected_deleted_text
+        completions = await lsp.request_completions(completions_filepath, start["line"], start["character"])
+        completions = [
+            completion["completionText"] for completion in completions
+            if completion_kind is None or completion["kind"] == completion_kind
+        ]
+        # Expected sets are compared regardless of the order and multiplicity of the completions
+        if isinstance(expected_completions, set):
+            completions = set(completions)
+        assert completions == expected_completions
 
 @pytest.mark.asyncio
 async def test_multilspy_java_example_repo_document_symbols() -> None:
@@ -218,209 +284,74 @@ async def test_multilspy_java_example_repo_document_symbols() -> None:
         "repo_url": "https://github.com/LakshyAAAgrawal/ExampleRepo/",
         "repo_commit": "f3762fd55a457ff9c6b0bf3b266de2b203a766ab",
     }
-    with create_test_context(params) as context:
+    async with create_async_test_context(params) as context:
         lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
 
         # All the communication with the language server must be performed inside the context manager
         # The server process is started when the context manager is entered and is terminated when the context manager is exited.
         async with lsp.start_server():
-            filepath = str(PurePath("Person.java"))
-            result = await lsp.request_document_symbols(filepath)
-
-            assert result == (
-                [
-                    {
-                        "name": "Person",
-                        "kind": 5,
-                        "range": {
-                            "start": {"line": 0, "character": 0},
-                            "end": {"line": 14, "character": 1},
-                        },
-                        "selectionRange": {
-                            "start": {"line": 1, "character": 22},
-                            "end": {"line": 1, "character": 28},
-                        },
-                        "detail": "",
-                    },
-                    {
-                        "name": "name",
-                        "kind": 8,
-                        "range": {
-                            "start": {"line": 2, "character": 4},
-                            "end": {"line": 3, "character": 24},
-                        },
-                        "selectionRange": {
-                            "start": {"line": 3, "character": 19},
-                            "end": {"line": 3, "character": 23},
-                        },
-                        "detail": "",
-                    },
-                    {
-                        "name": "Person(String)",
-                        "kind": 9,
-                        "range": {
-                            "start": {"line": 5, "character": 4},
-                            "end": {"line": 8, "character": 5},
-                        },
-                        "selectionRange": {
-                            "start": {"line": 6, "character": 11},
-                            "end": {"line": 6, "character": 17},
-                        },
-                        "detail": "",
-                    },
-                    {
-                        "name": "getName()",
-                        "kind": 6,
-                        "range": {
-                            "start": {"line": 10, "character": 4},
-                            "end": {"line": 13, "character": 5},
-                        },
-                        "selectionRange": {
-                            "start": {"line": 11, "character": 18},
-                            "end": {"line": 11, "character": 25},
-                        },
-                        "detail": " : String",
-                    },
-                ],
-                None,
+            # The two requests are independent, so they are in flight together
+            (person_symbols, person_tree), (student_symbols, student_tree) = await asyncio.gather(
+                lsp.request_document_symbols(_PERSON_JAVA),
+                lsp.request_document_symbols(_STUDENT_JAVA),
             )
 
-            filepath = str(PurePath("Student.java"))
-            result = await lsp.request_document_symbols(filepath)
-
-            assert result == (
-                [
-                    {
-                        "name": "Student",
-                        "kind": 5,
-                        "range": {
-                            "start": {"line": 0, "character": 0},
-                            "end": {"line": 16, "character": 1},
-                        },
-                        "selectionRange": {
-                            "start": {"line": 1, "character": 13},
-                            "end": {"line": 1, "character": 20},
-                        },
-                        "detail": "",
-                    },
-                    {
-                        "name": "id",
-                        "kind": 8,
-                        "range": {
-                            "start": {"line": 2, "character": 4},
-                            "end": {"line": 3, "character": 19},
-                        },
-                        "selectionRange": {
-                            "start": {"line": 3, "character": 16},
-                            "end": {"line": 3, "character": 18},
-                        },
-                        "detail": "",
-                    },
-                    {
-                        "name": "Student(String, int)",
-                        "kind": 9,
-                        "range": {
-                            "start": {"line": 5, "character": 4},
-                            "end": {"line": 10, "character": 5},
-                        },
-                        "selectionRange": {
-                            "start": {"line": 6, "character": 11},
-                            "end": {"line": 6, "character": 18},
-                        },
-                        "detail": "",
-                    },
-                    {
-                        "name": "getId()",
-                        "kind": 6,
-                        "range": {
-                            "start": {"line": 12, "character": 4},
-                            "end": {"line": 15, "character": 5},
-                        },
-                        "selectionRange": {
-                            "start": {"line": 13, "character": 15},
-                            "end": {"line": 13, "character": 20},
-                        },
-                        "detail": " : int",
-                    },
-                ],
-                None,
-            )
+            assert person_tree is None
+            assert tuple(map(_symbol_key, person_symbols)) == _EXPECTED_EXAMPLE_REPO_SYMBOLS["Person.java"]
+            assert student_tree is None
+            assert tuple(map(_symbol_key, student_symbols)) == _EXPECTED_EXAMPLE_REPO_SYMBOLS["Student.java"]
 
 @pytest.mark.asyncio
-async def test_multilspy_java_clickhouse_highlevel_sinker_modified_hover():
+async def test_multilspy_java_clickhouse_highlevel_sinker_modified_hover(clickhouse_sinker_modified_lsp: LanguageServer):
     """
     Test the working of textDocument/hover with Java repository - clickhouse-highlevel-sinker modified
     """
-    code_language = Language.JAVA
-    params = {
-        "code_language": code_language,
-        "repo_url": "https://github.com/LakshyAAAgrawal/clickhouse-highlevel-sinker/",
-        "repo_commit": "5775fd7a67e7b60998e1614cf44a8a1fc3190ab0"
-    }
-
-    with create_test_context(params) as context:
-        lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
-        # All the communication with the language server must be performed inside the context manager
-        # The server process is started when the context manager is entered and is terminated when the context manager is exited.
-        # The context manager is an asynchronous context manager, so it must be used with async with.
-        async with lsp.start_server():
-            filepath = "src/main/java/com/xlvchao/clickhouse/datasource/ClickHouseDataSource.java"
-            with lsp.open_file(filepath):
-                deleted_text = lsp.delete_text_between_positions(
-                    filepath,
-                    Position(line=75, character=28),
-                    Position(line=77, character=4)
-                )
-                assert deleted_text == """arr[0], Integer.parseInt(arr[1]))
+    lsp = clickhouse_sinker_modified_lsp
+    filepath = _CLICKHOUSE_DATA_SOURCE_JAVA
+    with lsp.open_file(filepath):
+        deleted_text = lsp.delete_text_between_positions(
+            filepath,
+            Position(line=75, character=28),
+            Position(line=77, character=4)
+        )
+        assert deleted_text == """arr[0], Integer.parseInt(arr[1]))
                 .build();
     """
 
-                lsp.insert_text_at_position(filepath, 75, 28, ")")
+        lsp.insert_text_at_position(filepath, 75, 28, ")")
                 
-                result = await lsp.request_hover(filepath, 75, 27)
+        result = await lsp.request_hover(filepath, 75, 27)
 
-                assert result == {
-                    "contents": {
-                        "language": "java",
-                        "value": "Builder com.xlvchao.clickhouse.datasource.ServerNode.Builder.withIpPort(String ip, Integer port)",
-                    }
-                }
+        assert result == {
+            "contents": {
+                "language": "java",
+                "value": "Builder com.xlvchao.clickhouse.datasource.ServerNode.Builder.withIpPort(String ip, Integer port)",
+            }
+        }
 
 @pytest.mark.asyncio
-async def test_multilspy_java_clickhouse_highlevel_sinker_modified_completion_method_signature():
+async def test_multilspy_java_clickhouse_highlevel_sinker_modified_completion_method_signature(clickhouse_sinker_modified_lsp: LanguageServer):
     """
     Test the working of textDocument/hover with Java repository - clickhouse-highlevel-sinker modified
     """
-    code_language = Language.JAVA
-    params = {
-        "code_language": code_language,
-        "repo_url": "https://github.com/LakshyAAAgrawal/clickhouse-highlevel-sinker/",
-        "repo_commit": "5775fd7a67e7b60998e1614cf44a8a1fc3190ab0"
-    }
-
-    with create_test_context(params) as context:
-        lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
-        # All the communication with the language server must be performed inside the context manager
-        # The server process is started when the context manager is entered and is terminated when the context manager is exited.
-        # The context manager is an asynchronous context manager, so it must be used with async with.
-        async with lsp.start_server():
-            filepath = "src/main/java/com/xlvchao/clickhouse/datasource/ClickHouseDataSource.java"
-            with lsp.open_file(filepath):
-                deleted_text = lsp.delete_text_between_positions(
-                    filepath,
-                    Position(line=75, character=27),
-                    Position(line=77, character=4)
-                )
-                assert deleted_text == """(arr[0], Integer.parseInt(arr[1]))
+    lsp = clickhouse_sinker_modified_lsp
+    filepath = _CLICKHOUSE_DATA_SOURCE_JAVA
+    with lsp.open_file(filepath):
+        deleted_text = lsp.delete_text_between_positions(
+            filepath,
+            Position(line=75, character=27),
+            Position(line=77, character=4)
+        )
+        assert deleted_text == """(arr[0], Integer.parseInt(arr[1]))
                 .build();
     """
                 
-                result = await lsp.request_completions(filepath, 75, 27)
+        result = await lsp.request_completions(filepath, 75, 27)
 
-                assert result == [
-                    {
-                        "completionText": "withIpPort",
-                        "detail": "Builder.withIpPort(String ip, Integer port) : Builder",
-                        "kind": 2,
-                    }
-                ]
+        assert result == [
+            {
+                "completionText": "withIpPort",
+                "detail": "Builder.withIpPort(String ip, Integer port) : Builder",
+                "kind": 2,
+            }
+        ]
@@ -0,0 +1,40 @@
+"""
+This file contains tests for the JSON encoding and parsing of the messages exchanged with the language servers, with
+and without orjson
+"""
+
+import math
+import pytest
+from multilspy.lsp_protocol_handler import server
+from multilspy.lsp_protocol_handler.server import _json_dumps, _json_loads
+
+def test_json_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Messages are encoded and parsed with json when orjson is not installed
+    """
+    monkeypatch.setattr(server, "orjson", None)
+    assert _json_dumps({"id": 1, "text": "é"}) == '{"id":1,"text":"é"}'.encode("utf-8")
+    assert _json_loads(b'{"id":1,"result":null}') == {"id": 1, "result": None}
+    # json writes NaN as the non-standard NaN token
+    assert _json_dumps({"value": math.nan}) == b'{"value":NaN}'
+
+def test_json_loads_falls_back_on_lone_surrogate() -> None:
+    """
+    A body with a lone surrogate escape, which orjson rejects, is parsed with json
+    """
+    pytest.importorskip("orjson")
+    assert _json_loads(b'{"text":"\\ud800"}') == {"text": "\ud800"}
+
+def test_json_dumps_falls_back_on_non_str_keys() -> None:
+    """
+    A payload with non-str keys, which orjson rejects, is encoded with json
+    """
+    pytest.importorskip("orjson")
+    assert _json_dumps({1: "a"}) == b'{"1":"a"}'
+
+def test_json_dumps_nan_with_orjson() -> None:
+    """
+    orjson writes NaN as null, unlike json
+    """
+    pytest.importorskip("orjson")
+    assert _json_dumps({"value": math.nan}) == b'{"value":null}'
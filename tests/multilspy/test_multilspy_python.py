@@ -2,13 +2,19 @@
 This file contains tests for running the Python Language Server: jedi-language-server
 """
 
+import asyncio
 import pytest
 from multilspy import LanguageServer
 from multilspy.multilspy_config import Language
-from tests.test_utils import create_test_context
+from tests.test_utils import create_async_test_context, load_locations_fixture, project_locations
 from pathlib import PurePath
 
+_MODE_PY = str(PurePath("src/black/mode.py"))
+
+_EXPECTED_MODE_REFERENCES = load_locations_fixture("python_black_mode_references")
+
 pytest_plugins = ("pytest_asyncio",)
+pytestmark = pytest.mark.xdist_group(name="python")
 
 @pytest.mark.asyncio
 async def test_multilspy_python_black():
@@ -21,88 +27,29 @@ async def test_multilspy_python_black():
         "repo_url": "https://github.com/psf/black/",
         "repo_commit": "f3b50e466969f9142393ec32a4b2a383ffbe5f23"
     }
-    with create_test_context(params) as context:
+    async with create_async_test_context(params) as context:
         lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
 
         # All the communication with the language server must be performed inside the context manager
         # The server process is started when the context manager is entered and is terminated when the context manager is exited.
         # The context manager is an asynchronous context manager, so it must be used with async with.
         async with lsp.start_server():
-            result = await lsp.request_definition(str(PurePath("src/black/mode.py")), 163, 4)
-
-            assert isinstance(result, list)
-            assert len(result) == 1
-            item = result[0]
-            assert item["relativePath"] == str(PurePath("src/black/mode.py"))
-            assert item["range"] == {
-                "start": {"line": 163, "character": 4},
-                "end": {"line": 163, "character": 20},
-            }
-
-            result = await lsp.request_references(str(PurePath("src/black/mode.py")), 163, 4)
-
-            assert isinstance(result, list)
-            assert len(result) == 8
-
-            for item in result:
-                del item["uri"]
-                del item["absolutePath"]
-
-            assert result == [
-                {
-                    "relativePath": str(PurePath("src/black/__init__.py")),
-                    "range": {
-                        "start": {"line": 71, "character": 4},
-                        "end": {"line": 71, "character": 20},
-                    },
-                },
-                {
-                    "relativePath": str(PurePath("src/black/__init__.py")),
-                    "range": {
-                        "start": {"line": 1105, "character": 11},
-                        "end": {"line": 1105, "character": 27},
-                    },
-                },
-                {
-                    "relativePath": str(PurePath("src/black/__init__.py")),
-                    "range": {
-                        "start": {"line": 1113, "character": 11},
-                        "end": {"line": 1113, "character": 27},
-                    },
-                },
-                {
-                    "relativePath": str(PurePath("src/black/mode.py")),
-                    "range": {
-                        "start": {"line": 163, "character": 4},
-                        "end": {"line": 163, "character": 20},
-                    },
-                },
-                {
-                    "relativePath": str(PurePath("src/black/parsing.py")),
-                    "range": {
-                        "start": {"line": 7, "character": 68},
-                        "end": {"line": 7, "character": 84},
-                    },
-                },
-                {
-                    "relativePath": str(PurePath("src/black/parsing.py")),
-                    "range": {
-                        "start": {"line": 37, "character": 11},
-                        "end": {"line": 37, "character": 27},
-                    },
-                },
-                {
-                    "relativePath": str(PurePath("src/black/parsing.py")),
-                    "range": {
-                        "start": {"line": 39, "character": 14},
-                        "end": {"line": 39, "character": 30},
-                    },
-                },
-                {
-                    "relativePath": str(PurePath("src/black/parsing.py")),
-                    "range": {
-                        "start": {"line": 44, "character": 11},
-                        "end": {"line": 44, "character": 27},
-                    },
-                },
-            ]
\ No newline at end of file
+            with lsp.open_file(_MODE_PY):
+                definition_result, references_result = await asyncio.gather(
+                    lsp.request_definition(_MODE_PY, 163, 4),
+                    lsp.request_references(_MODE_PY, 163, 4),
+                )
+
+                assert isinstance(definition_result, list)
+                assert len(definition_result) == 1
+                item = definition_result[0]
+                assert item["relativePath"] == _MODE_PY
+                assert item["range"] == {
+                    "start": {"line": 163, "character": 4},
+                    "end": {"line": 163, "character": 20},
+                }
+
+                assert isinstance(references_result, list)
+                assert len(references_result) == 8
+
+                assert tuple(project_locations(references_result)) == _EXPECTED_MODE_REFERENCES
@@ -2,16 +2,24 @@
 This file contains tests for running the Rust Language Server: rust-analyzer
 """
 
-import unittest
+import asyncio
 import pytest
 
 from multilspy import LanguageServer
 from multilspy.multilspy_config import Language
 from multilspy.multilspy_types import Position, CompletionItemKind
-from tests.test_utils import create_test_context
+from tests.test_utils import create_async_test_context, assert_same_items, load_locations_fixture, project_locations
 from pathlib import PurePath
 
+# The relative paths returned by multilspy use the platform's path separator
+_BRIDGE_RS = str(PurePath("src/browser/bridge.rs"))
+_TTY_RS = str(PurePath("src/input/tty.rs"))
+
+# rust-analyzer does not return references in a fixed order, so they are compared with assert_same_items
+_EXPECTED_TTY_REFERENCES = load_locations_fixture("rust_carbonyl_tty_references")
+
 pytest_plugins = ("pytest_asyncio",)
+pytestmark = pytest.mark.xdist_group(name="rust")
 
 @pytest.mark.asyncio
 async def test_multilspy_rust_carbonyl():
@@ -24,53 +32,31 @@ async def test_multilspy_rust_carbonyl():
         "repo_url": "https://github.com/fathyb/carbonyl/",
         "repo_commit": "ab80a276b1bd1c2c8dcefc8f248415dfc61dc2bf"
     }
-    with create_test_context(params) as context:
+    async with create_async_test_context(params) as context:
         lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
 
         # All the communication with the language server must be performed inside the context manager
         # The server process is started when the context manager is entered and is terminated when the context manager is exited.
         # The context manager is an asynchronous context manager, so it must be used with async with.
         async with lsp.start_server():
-            result = await lsp.request_definition(str(PurePath("src/browser/bridge.rs")), 132, 18)
+            definition_result, references_result = await asyncio.gather(
+                lsp.request_definition(_BRIDGE_RS, 132, 18),
+                lsp.request_references(_TTY_RS, 43, 15),
+            )
 
-            assert isinstance(result, list)
-            assert len(result) == 1
-            item = result[0]
-            assert item["relativePath"] == str(PurePath("src/input/tty.rs"))
+            assert isinstance(definition_result, list)
+            assert len(definition_result) == 1
+            item = definition_result[0]
+            assert item["relativePath"] == _TTY_RS
             assert item["range"] == {
                 "start": {"line": 43, "character": 11},
                 "end": {"line": 43, "character": 19},
             }
 
-            result = await lsp.request_references(str(PurePath("src/input/tty.rs")), 43, 15)
+            assert isinstance(references_result, list)
+            assert len(references_result) == 2
 
-            assert isinstance(result, list)
-            assert len(result) == 2
-
-            for item in result:
-                del item["uri"]
-                del item["absolutePath"]
-
-            case = unittest.TestCase()
-            case.assertCountEqual(
-                result,
-                [
-                    {
-                        "relativePath": str(PurePath("src/browser/bridge.rs")),
-                        "range": {
-                            "start": {"line": 132, "character": 13},
-                            "end": {"line": 132, "character": 21},
-                        },
-                    },
-                    {
-                        "relativePath": str(PurePath("src/input/tty.rs")),
-                        "range": {
-                            "start": {"line": 16, "character": 13},
-                            "end": {"line": 16, "character": 21},
-                        },
-                    },
-                ],
-            )
+            assert_same_items(project_locations(references_result), _EXPECTED_TTY_REFERENCES)
 
 @pytest.mark.asyncio
 async def test_multilspy_rust_completions_mediaplayer() -> None:
@@ -84,7 +70,7 @@ async def test_multilspy_rust_completions_mediaplayer() -> None:
         "repo_commit": "ba27bb16c7ba1d88808300364af65eb69b1d84a8",
     }
 
-    with create_test_context(params) as context:
+    async with create_async_test_context(params) as context:
         lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
         filepath = "src/playlist.rs"
         # All the communication with the language server must be performed inside the context manager
@@ -2,53 +2,46 @@
 This file contains tests for running the TypeScript Language Server: typescript-language-server
 """
 
+import asyncio
 import pytest
 from multilspy import LanguageServer
-from multilspy.multilspy_config import Language
-from tests.test_utils import create_test_context
+from tests.test_utils import create_async_test_context, assert_same_items, load_locations_fixture, project_locations
+from tests.multilspy.multilspy_repositories import TRPC_PARAMS
 from pathlib import PurePath
 
+_ROUTER_TS = str(PurePath("packages/server/src/core/router.ts"))
+
+_EXPECTED_ROUTER_REFERENCES = load_locations_fixture("typescript_trpc_router_references")
+
 pytest_plugins = ("pytest_asyncio",)
+pytestmark = pytest.mark.xdist_group(name="typescript")
 
 @pytest.mark.asyncio
 async def test_multilspy_typescript_trpc():
     """
     Test the working of multilspy with typescript repository - trpc
     """
-    code_language = Language.TYPESCRIPT
-    params = {
-        "code_language": code_language,
-        "repo_url": "https://github.com/trpc/trpc/",
-        "repo_commit": "936db6dd2598337758e29c843ff66984ed54faaf"
-    }
-    with create_test_context(params) as context:
+    async with create_async_test_context(TRPC_PARAMS) as context:
         lsp = LanguageServer.create(context.config, context.logger, context.source_directory)
 
         # All the communication with the language server must be performed inside the context manager
         # The server process is started when the context manager is entered and is terminated when the context manager is exited.
         # The context manager is an asynchronous context manager, so it must be used with async with.
         async with lsp.start_server():
-            path = str(PurePath("packages/server/src/core/router.ts"))
-            result = await lsp.request_definition(path, 194, 8)
-            assert isinstance(result, list)
-            assert len(result) == 1
-
-            item = result[0]
+            path = _ROUTER_TS
+            definition_result, references_result = await asyncio.gather(
+                lsp.request_definition(path, 194, 8),
+                lsp.request_references(path, 194, 8),
+            )
+
+            assert isinstance(definition_result, list)
+            (item,) = definition_result
             assert item["relativePath"] == path
             assert item["range"] == {
                 "start": {"line": 194, "character": 2},
                 "end": {"line": 194, "character": 8},
             }
 
-            result = await lsp.request_references(path, 194, 8)
-            assert isinstance(result, list)
-            assert len(result) == 2
-
-            for item in result:
-                del item["uri"]
-                del item["absolutePath"]
-
-            assert result == [
-                {'range': {'start': {'line': 231, 'character': 15}, 'end': {'line': 231, 'character': 21}}, 'relativePath': path}, 
-                {'range': {'start': {'line': 264, 'character': 12}, 'end': {'line': 264, 'character': 18}}, 'relativePath': path}
-            ]
\ No newline at end of file
+            assert isinstance(references_result, list)
+            # tsserver does not guarantee the order of the references
+            assert_same_items(project_locations(references_result), _EXPECTED_ROUTER_REFERENCES)
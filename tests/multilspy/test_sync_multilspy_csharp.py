@@ -3,11 +3,18 @@ This file contains tests for running the C# Language Server: OmniSharp
 """
 
 
+import pytest
 from multilspy import SyncLanguageServer
 from multilspy.multilspy_config import Language
-from tests.test_utils import create_test_context
+from tests.test_utils import create_test_context, project_locations
 from pathlib import PurePath
 
+_AUDIO_INPUT_MANAGER_CS = str(PurePath("src/Ryujinx.Audio/Input/AudioInputManager.cs"))
+_CONSTANTS_CS = str(PurePath("src/Ryujinx.Audio/Constants.cs"))
+_AUDIO_INPUT_SYSTEM_CS = str(PurePath("src/Ryujinx.Audio/Input/AudioInputSystem.cs"))
+
+pytestmark = pytest.mark.xdist_group(name="csharp")
+
 
 def test_multilspy_csharp_ryujinx() -> None:
     """
@@ -25,36 +32,34 @@ def test_multilspy_csharp_ryujinx() -> None:
         # All the communication with the language server must be performed inside the context manager
         # The server process is started when the context manager is entered and is terminated when the context manager is exited.
         with lsp.start_server():
-            result = lsp.request_definition(str(PurePath("src/Ryujinx.Audio/Input/AudioInputManager.cs")), 176, 44)
+            result = lsp.request_definition(_AUDIO_INPUT_MANAGER_CS, 176, 44)
 
             assert isinstance(result, list)
             assert len(result) == 1
             item = result[0]
-            assert item["relativePath"] == str(PurePath("src/Ryujinx.Audio/Constants.cs"))
+            assert item["relativePath"] == _CONSTANTS_CS
             assert item["range"] == {
                 "start": {"line": 15, "character": 28},
                 "end": {"line": 15, "character": 50},
             }
 
-            result = lsp.request_references(str(PurePath("src/Ryujinx.Audio/Constants.cs")), 15, 40)
+            result = lsp.request_references(_CONSTANTS_CS, 15, 40)
 
             assert isinstance(result, list)
             assert len(result) == 2
 
-            for item in result:
-                del item["uri"]
-                del item["absolutePath"]
+            result = project_locations(result)
 
             assert result == [
                 {
-                    "relativePath": str(PurePath("src/Ryujinx.Audio/Input/AudioInputManager.cs")),
+                    "relativePath": _AUDIO_INPUT_MANAGER_CS,
                     "range": {
                         "start": {"line": 176, "character": 37},
                         "end": {"line": 176, "character": 59},
                     },
                 },
                 {
-                    "relativePath": str(PurePath("src/Ryujinx.Audio/Input/AudioInputSystem.cs")),
+                    "relativePath": _AUDIO_INPUT_SYSTEM_CS,
                     "range": {
                         "start": {"line": 77, "character": 29},
                         "end": {"line": 77, "character": 51},
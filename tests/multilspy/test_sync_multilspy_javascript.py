@@ -2,11 +2,16 @@
 This file contains tests for running the JavaScript Language Server: typescript-language-server
 """
 
+import pytest
 from multilspy import SyncLanguageServer
 from multilspy.multilspy_config import Language
-from tests.test_utils import create_test_context
+from tests.test_utils import create_test_context, project_locations
 from pathlib import PurePath
 
+_CSV_JS = str(PurePath("lib/csv/csv.js"))
+
+pytestmark = pytest.mark.xdist_group(name="typescript")
+
 def test_sync_multilspy_javascript_exceljs() -> None:
     """
     Test the working of multilspy with javascript repository - exceljs
@@ -23,7 +28,7 @@ def test_sync_multilspy_javascript_exceljs() -> None:
         # All the communication with the language server must be performed inside the context manager
         # The server process is started when the context manager is entered and is terminated when the context manager is exited.
         with lsp.start_server():
-            path = str(PurePath("lib/csv/csv.js"))
+            path = _CSV_JS
             result = lsp.request_definition(path, 108, 3)
             assert isinstance(result, list)
             assert len(result) == 1
@@ -39,11 +44,7 @@ def test_sync_multilspy_javascript_exceljs() -> None:
             assert isinstance(result, list)
             assert len(result) == 2
 
-            for item in result:
-                del item["uri"]
-                del item["absolutePath"]
-
-            assert result == [
+            assert project_locations(result) == [
                 {'range': {'start': {'line': 180, 'character': 16}, 'end': {'line': 180, 'character': 21}}, 'relativePath': path},
                 {'range': {'start': {'line': 185, 'character': 15}, 'end': {'line': 185, 'character': 20}}, 'relativePath': path}
             ]
@@ -0,0 +1,76 @@
+"""
+This file contains tests for the thread on which SyncLanguageServer talks to the language server, run against a stub
+language server
+"""
+
+import pytest
+import threading
+from multilspy import SyncLanguageServer
+from multilspy.multilspy_exceptions import MultilspyException
+from multilspy.multilspy_types import Position
+from tests.multilspy.stub_language_server import StubLanguageServer
+
+_MAIN_PY = "main.py"
+
+def test_sync_notifications_on_loop_thread() -> None:
+    """
+    Opening, editing and closing a file send their notifications from the event loop thread, which owns the pipe to
+    the server process, and not from the calling thread
+    """
+    lsp = SyncLanguageServer(StubLanguageServer())
+    with lsp.start_server():
+        loop_thread_ident = lsp.loop_thread.ident
+        with lsp.open_file(_MAIN_PY):
+            lsp.insert_text_at_position(_MAIN_PY, 0, 0, "x")
+            lsp.delete_text_between_positions(_MAIN_PY, Position(line=0, character=0), Position(line=0, character=1))
+
+    assert loop_thread_ident != threading.get_ident()
+    assert lsp.language_server.notification_threads == {loop_thread_ident}
+
+def test_sync_open_file_closes_on_error() -> None:
+    """
+    An exception raised within open_file is propagated after the file is closed on the event loop thread
+    """
+    lsp = SyncLanguageServer(StubLanguageServer())
+    with lsp.start_server():
+        loop_thread_ident = lsp.loop_thread.ident
+        with pytest.raises(ValueError):
+            with lsp.open_file(_MAIN_PY):
+                raise ValueError()
+
+    assert lsp.language_server.notification_threads == {loop_thread_ident}
+
+def test_sync_requests_on_loop_thread() -> None:
+    """
+    Requests run on the one event loop thread started with the server, and do not start threads of their own
+    """
+    lsp = SyncLanguageServer(StubLanguageServer())
+    with lsp.start_server():
+        loop_thread_ident = lsp.loop_thread.ident
+        thread_count = threading.active_count()
+        for line in range(3):
+            lsp.request_definition(_MAIN_PY, line, 0)
+        assert threading.active_count() == thread_count
+
+    assert lsp.language_server.request_count == 3
+    assert lsp.language_server.request_threads == {loop_thread_ident}
+
+@pytest.mark.parametrize("started_before", [False, True])
+def test_sync_file_operations_outside_server(started_before: bool) -> None:
+    """
+    Opening and editing a file before the server is started, or after it is stopped, raise instead of waiting on an
+    event loop that is not running
+    """
+    lsp = SyncLanguageServer(StubLanguageServer())
+    if started_before:
+        with lsp.start_server():
+            pass
+
+    with pytest.raises(MultilspyException, match="Language Server not started"):
+        with lsp.open_file(_MAIN_PY):
+            pass
+    with pytest.raises(MultilspyException, match="Language Server not started"):
+        lsp.insert_text_at_position(_MAIN_PY, 0, 0, "x")
+    with pytest.raises(MultilspyException, match="Language Server not started"):
+        lsp.delete_text_between_positions(_MAIN_PY, Position(line=0, character=0), Position(line=0, character=1))
+    assert lsp.language_server.notification_threads == set()
@@ -0,0 +1,46 @@
+"""
+This file contains tests for request_batch of SyncLanguageServer, run against a stub language server
+"""
+
+import pytest
+from multilspy import SyncLanguageServer
+from multilspy.multilspy_exceptions import MultilspyException
+from tests.multilspy.stub_language_server import StubLanguageServer
+
+_MAIN_PY = "main.py"
+
+def test_sync_request_batch_order() -> None:
+    """
+    The results are returned in the order of the requests, even when the responses arrive in another order
+    """
+    lsp = SyncLanguageServer(StubLanguageServer())
+    with lsp.start_server():
+        references_result, definition_result = lsp.request_batch(
+            [("references", (_MAIN_PY, 1, 2)), ("definition", (_MAIN_PY, 3, 4))]
+        )
+
+    assert definition_result == [{"relativePath": _MAIN_PY, "line": 3, "column": 4, "request": 1}]
+    assert references_result == [{"relativePath": _MAIN_PY, "line": 1, "column": 2, "request": 2}]
+
+def test_sync_request_batch_on_loop_thread() -> None:
+    """
+    The batched requests run on the event loop thread started with the server
+    """
+    lsp = SyncLanguageServer(StubLanguageServer())
+    with lsp.start_server():
+        loop_thread_ident = lsp.loop_thread.ident
+        lsp.request_batch([("definition", (_MAIN_PY, 1, 2)), ("references", (_MAIN_PY, 1, 2))])
+
+    assert lsp.language_server.request_threads == {loop_thread_ident}
+
+@pytest.mark.parametrize("name", ["unknown", "batch"])
+def test_sync_request_batch_unknown_request(name: str) -> None:
+    """
+    A batch with an unknown request raises before any of its requests is sent
+    """
+    lsp = SyncLanguageServer(StubLanguageServer())
+    with lsp.start_server():
+        with pytest.raises(MultilspyException, match=f"Unknown request '{name}'"):
+            lsp.request_batch([("definition", (_MAIN_PY, 1, 2)), (name, ())])
+
+    assert lsp.language_server.request_count == 0
@@ -0,0 +1,81 @@
+"""
+This file contains tests for the response cache of SyncLanguageServer, run against a stub language server
+"""
+
+import pytest
+from multilspy import SyncLanguageServer
+from multilspy.multilspy_types import Position
+from tests.multilspy.stub_language_server import StubLanguageServer
+
+_MAIN_PY = "main.py"
+
+def _create_stub_lsp(cache_responses: bool = True) -> SyncLanguageServer:
+    return SyncLanguageServer(StubLanguageServer(), cache_responses=cache_responses)
+
+def test_sync_response_cache_hit() -> None:
+    """
+    Repeated requests are answered from the cache, and only when caching is enabled
+    """
+    lsp = _create_stub_lsp()
+    with lsp.start_server():
+        first = lsp.request_definition(_MAIN_PY, 1, 2)
+        assert lsp.request_definition(_MAIN_PY, 1, 2) == first
+        assert lsp.request_definition(_MAIN_PY, 3, 4) != first
+        assert lsp.language_server.request_count == 2
+
+    lsp = _create_stub_lsp(cache_responses=False)
+    with lsp.start_server():
+        assert lsp.request_definition(_MAIN_PY, 1, 2) != lsp.request_definition(_MAIN_PY, 1, 2)
+        assert lsp.language_server.request_count == 2
+
+def test_sync_response_cache_returns_copies() -> None:
+    """
+    Modifying a returned response does not modify the cached one
+    """
+    lsp = _create_stub_lsp()
+    with lsp.start_server():
+        first = lsp.request_definition(_MAIN_PY, 1, 2)
+        first[0]["relativePath"] = "modified.py"
+        first.append({})
+        assert lsp.request_definition(_MAIN_PY, 1, 2) == [
+            {"relativePath": _MAIN_PY, "line": 1, "column": 2, "request": 1}
+        ]
+        assert lsp.language_server.request_count == 1
+
+@pytest.mark.parametrize("edit", [
+    pytest.param(lambda lsp: lsp.insert_text_at_position(_MAIN_PY, 0, 0, "x"), id="insert"),
+    pytest.param(lambda lsp: lsp.delete_text_between_positions(_MAIN_PY, Position(line=0, character=0), Position(line=0, character=1)), id="delete"),
+])
+def test_sync_response_cache_invalidated_by_edits(edit) -> None:
+    """
+    An edit drops the responses cached before it
+    """
+    lsp = _create_stub_lsp()
+    with lsp.start_server():
+        with lsp.open_file(_MAIN_PY):
+            before_edit = lsp.request_definition(_MAIN_PY, 1, 2)
+            edit(lsp)
+            after_edit = lsp.request_definition(_MAIN_PY, 1, 2)
+            assert after_edit != before_edit
+            assert lsp.request_definition(_MAIN_PY, 1, 2) == after_edit
+
+def test_sync_response_cache_invalidated_by_close() -> None:
+    """
+    Closing an edited file drops the responses computed against the edited buffer
+    """
+    lsp = _create_stub_lsp()
+    with lsp.start_server():
+        with lsp.open_file(_MAIN_PY):
+            lsp.insert_text_at_position(_MAIN_PY, 0, 0, "x")
+            edited = lsp.request_definition(_MAIN_PY, 1, 2)
+        assert lsp.request_definition(_MAIN_PY, 1, 2) != edited
+
+def test_sync_response_cache_invalidated_by_restart() -> None:
+    """
+    Restarting the server drops the responses of the previous server
+    """
+    lsp = _create_stub_lsp()
+    with lsp.start_server():
+        first = lsp.request_definition(_MAIN_PY, 1, 2)
+    with lsp.start_server():
+        assert lsp.request_definition(_MAIN_PY, 1, 2) != first
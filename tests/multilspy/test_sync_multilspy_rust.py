@@ -2,13 +2,22 @@
 This file contains tests for running the Rust Language Server: rust-analyzer
 """
 
-import unittest
+import pytest
 
 from multilspy import SyncLanguageServer
 from multilspy.multilspy_config import Language
-from tests.test_utils import create_test_context
+from tests.test_utils import create_test_context, assert_same_items, load_locations_fixture, project_locations
 from pathlib import PurePath
 
+pytestmark = pytest.mark.xdist_group(name="rust")
+
+# The relative paths returned by multilspy use the platform's path separator
+_BRIDGE_RS = str(PurePath("src/browser/bridge.rs"))
+_TTY_RS = str(PurePath("src/input/tty.rs"))
+
+# rust-analyzer does not return references in a fixed order, so they are compared with assert_same_items
+_EXPECTED_TTY_REFERENCES = load_locations_fixture("rust_carbonyl_tty_references")
+
 def test_multilspy_rust_carbonyl() -> None:
     """
     Test the working of multilspy with rust repository - carbonyl
@@ -25,43 +34,22 @@ def test_multilspy_rust_carbonyl() -> None:
         # All the communication with the language server must be performed inside the context manager
         # The server process is started when the context manager is entered and is terminated when the context manager is exited.
         with lsp.start_server():
-            result = lsp.request_definition(str(PurePath("src/browser/bridge.rs")), 132, 18)
+            result = lsp.request_definition(_BRIDGE_RS, 132, 18)
 
             assert isinstance(result, list)
             assert len(result) == 1
             item = result[0]
-            assert item["relativePath"] == str(PurePath("src/input/tty.rs"))
+            assert item["relativePath"] == _TTY_RS
             assert item["range"] == {
                 "start": {"line": 43, "character": 11},
                 "end": {"line": 43, "character": 19},
             }
 
-            result = lsp.request_references(str(PurePath("src/input/tty.rs")), 43, 15)
+            result = lsp.request_references(_TTY_RS, 43, 15)
 
             assert isinstance(result, list)
             assert len(result) == 2
 
-            for item in result:
-                del item["uri"]
-                del item["absolutePath"]
+            result = project_locations(result)
 
-            case = unittest.TestCase()
-            case.assertCountEqual(
-                result,
-                [
-                    {
-                        "relativePath": str(PurePath("src/browser/bridge.rs")),
-                        "range": {
-                            "start": {"line": 132, "character": 13},
-                            "end": {"line": 132, "character": 21},
-                        },
-                    },
-                    {
-                        "relativePath": str(PurePath("src/input/tty.rs")),
-                        "range": {
-                            "start": {"line": 16, "character": 13},
-                            "end": {"line": 16, "character": 21},
-                        },
-                    },
-                ],
-            )
+            assert_same_items(result, _EXPECTED_TTY_REFERENCES)
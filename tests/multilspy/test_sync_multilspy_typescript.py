@@ -2,49 +2,54 @@
 This file contains tests for running the TypeScript Language Server: typescript-language-server
 """
 
+import pytest
 from multilspy import SyncLanguageServer
-from multilspy.multilspy_config import Language
-from tests.test_utils import create_test_context
+from tests.test_utils import assert_same_items, load_locations_fixture, project_locations
 from pathlib import PurePath
-import os
-def test_sync_multilspy_typescript_trpc() -> None:
-    """
-    Test the working of multilspy with typescript repository - trpc
-    """
-    code_language = Language.TYPESCRIPT
-    params = {
-        "code_language": code_language,
-        "repo_url": "https://github.com/trpc/trpc/",
-        "repo_commit": "936db6dd2598337758e29c843ff66984ed54faaf"
-    }
-    with create_test_context(params) as context:
-        lsp = SyncLanguageServer.create(context.config, context.logger, context.source_directory)
 
-        # All the communication with the language server must be performed inside the context manager
-        # The server process is started when the context manager is entered and is terminated when the context manager is exited.
-        with lsp.start_server():
-            path = str(PurePath("packages/server/src/core/router.ts"))
-            result = lsp.request_definition(path, 194, 8)
-            assert isinstance(result, list)
-            assert len(result) == 1
+_ROUTER_TS = str(PurePath("packages/server/src/core/router.ts"))
 
-            item = result[0]
-            assert item["relativePath"] == path
-            assert item["range"] == {
-                "start": {"line": 194, "character": 2},
-                "end": {"line": 194, "character": 8},
-            }
+_EXPECTED_ROUTER_REFERENCES = load_locations_fixture("typescript_trpc_router_references")
 
-            result = lsp.request_references(path, 194, 8)
-            assert isinstance(result, list)
-            assert len(result) == 2
+pytestmark = pytest.mark.xdist_group(name="typescript")
 
-            for item in result:
-                del item["uri"]
-                del item["absolutePath"]
+@pytest.mark.parametrize(
+    "path, line, column, expected_definition, expected_references",
+    [
+        pytest.param(
+            _ROUTER_TS,
+            194,
+            8,
+            [
+                {'range': {'start': {'line': 194, 'character': 2}, 'end': {'line': 194, 'character': 8}}, 'relativePath': _ROUTER_TS},
+            ],
+            _EXPECTED_ROUTER_REFERENCES,
+            id="router.ts:194:8",
+        ),
+    ],
+)
+def test_sync_multilspy_typescript_trpc(
+    trpc_lsp: SyncLanguageServer,
+    path: str,
+    line: int,
+    column: int,
+    expected_definition: list,
+    expected_references: list,
+) -> None:
+    """
+    Test the working of multilspy with typescript repository - trpc
+    """
+    lsp = trpc_lsp
+    # The file stays open across both requests, so tsserver loads it and its project once, before the first one
+    with lsp.open_file(path):
+        # The two requests are independent, so they are sent together
+        definition_result, references_result = lsp.request_batch(
+            [("definition", (path, line, column)), ("references", (path, line, column))]
+        )
 
-            assert result == [
-                {'range': {'start': {'line': 231, 'character': 15}, 'end': {'line': 231, 'character': 21}}, 'relativePath': path}, 
-                {'range': {'start': {'line': 264, 'character': 12}, 'end': {'line': 264, 'character': 18}}, 'relativePath': path}
-            ]
+        assert isinstance(definition_result, list)
+        assert project_locations(definition_result) == expected_definition
 
+        assert isinstance(references_result, list)
+        # tsserver does not guarantee the order of the references
+        assert_same_items(project_locations(references_result), expected_references)
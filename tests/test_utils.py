@@ -1,15 +1,197 @@
+import asyncio
+import hashlib
+import json
 import os
 import pathlib
 import contextlib
+import fnmatch
 import shutil
+import stat
+import zipfile
 
-from multilspy.multilspy_config import MultilspyConfig
+from multilspy.multilspy_config import Language, MultilspyConfig
 from multilspy.multilspy_logger import MultilspyLogger
 from tests.multilspy.multilspy_context import MultilspyContext
-from typing import Iterator
+from typing import Any, AsyncIterator, Iterator, List
 from uuid import uuid4
 from multilspy.multilspy_utils import FileUtils
 
+def load_test_fixture(name: str) -> Any:
+    """
+    Loads the expected result stored in tests/multilspy/fixtures/{name}.json
+    """
+    fixture_path = pathlib.Path(__file__).parent / "multilspy" / "fixtures" / f"{name}.json"
+    with open(fixture_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def load_locations_fixture(name: str) -> tuple:
+    """
+    Loads the LSP locations stored in tests/multilspy/fixtures/{name}.json as a tuple. The relative paths in the
+    fixture use '/' as separator, and are converted to the separator of the platform.
+    """
+    return tuple(
+        {"relativePath": str(pathlib.PurePath(location["relativePath"])), "range": location["range"]}
+        for location in load_test_fixture(name)
+    )
+
+def _get_test_repository_cache_directory() -> str:
+    """
+    Returns the directory in which the test repositories are cached across test runs. It can be set with the
+    MULTILSPY_TEST_CACHE environment variable.
+    """
+    default_cache_directory = str(pathlib.Path(os.path.expanduser("~"), ".multilspy", "test_repos"))
+    return os.path.expanduser(os.environ.get("MULTILSPY_TEST_CACHE", default_cache_directory))
+
+def _is_under_sparse_path(relative_name: str, sparse_path: str) -> bool:
+    """
+    Returns whether the archive member {relative_name} is the file or directory {sparse_path}, or is inside it. The
+    paths are matched segment by segment, so that a wildcard never matches a '/', as in a shell.
+    """
+    name_segments = relative_name.split("/")
+    path_segments = sparse_path.split("/")
+    return len(name_segments) >= len(path_segments) and all(
+        fnmatch.fnmatchcase(name_segment, path_segment)
+        for name_segment, path_segment in zip(name_segments, path_segments)
+    )
+
+def _extract_sparse_archive(logger: MultilspyLogger, url: str, target_path: str, sparse_paths: List[str]) -> None:
+    """
+    Downloads the zip archive of a repository from the given URL and extracts to {target_path} only the files and
+    directories in {sparse_paths}. The paths are relative to the repository root, and use '/' as separator. They can
+    contain shell-style wildcards, like "tsconfig*.json", which do not match '/'. A directory that matches a path is
+    extracted with all its contents.
+    """
+    archive_path = f"{target_path}.zip"
+    try:
+        FileUtils.download_file(logger, url, archive_path)
+        with zipfile.ZipFile(archive_path) as archive:
+            members = []
+            for name in archive.namelist():
+                # Every member of a GitHub archive is under a single top-level directory
+                relative_name = name.partition("/")[2].rstrip("/")
+                if any(_is_under_sparse_path(relative_name, path) for path in sparse_paths):
+                    members.append(name)
+            assert len(members) > 0, f"None of {sparse_paths} is in the archive obtained from '{url}'"
+            archive.extractall(target_path, members)
+    finally:
+        if os.path.exists(archive_path):
+            os.remove(archive_path)
+
+def _get_cached_test_repository(params: dict, logger: MultilspyLogger) -> str:
+    """
+    Returns the path to the sources of the repository given by the parameters in the test repository cache,
+    downloading them first if they are not cached yet.
+
+    If the parameters have "sparse_paths", only those paths of the repository are extracted. This keeps large
+    repositories small on disk, and limits what the language server indexes.
+    """
+    assert params['repo_url'].endswith('/')
+    sparse_paths = sorted(path.strip("/") for path in params.get('sparse_paths', []))
+    # Forks share commits, so the cache is keyed by the repository as well as the commit
+    cache_key_source = params['repo_url'] + params['repo_commit'] + "".join("\n" + path for path in sparse_paths)
+    cache_key = hashlib.sha256(cache_key_source.encode("utf-8")).hexdigest()
+    cache_directory = str(pathlib.Path(_get_test_repository_cache_directory(), cache_key))
+    if not os.path.exists(cache_directory):
+        # The archive is extracted into a private directory, which is then renamed into place at once, so that
+        # concurrent test processes never see a partially extracted repository
+        download_directory = f"{cache_directory}.{uuid4().hex}.tmp"
+        os.makedirs(download_directory)
+        try:
+            repo_zip_url = params['repo_url'] + f"archive/{params['repo_commit']}.zip"
+            if sparse_paths:
+                _extract_sparse_archive(logger, repo_zip_url, download_directory, sparse_paths)
+            else:
+                FileUtils.download_and_extract_archive(logger, repo_zip_url, download_directory, "zip")
+            try:
+                os.rename(download_directory, cache_directory)
+            except OSError:
+                # Another test process has cached the repository in the meantime
+                pass
+            else:
+                _make_files_read_only(cache_directory)
+        finally:
+            _remove_directory(download_directory)
+
+    # The modification time of each cached repository records its last use, so that CI can prune unused ones
+    os.utime(cache_directory)
+    dir_contents = os.listdir(cache_directory)
+    assert len(dir_contents) == 1
+    return str(pathlib.Path(cache_directory, dir_contents[0]))
+
+def _make_files_read_only(directory: str) -> None:
+    """
+    Removes the write permission from every file under {directory}. Workspaces may hard-link these files, so a language
+    server or build tool that opens one of them for writing gets a permission error instead of corrupting the cache for
+    later runs. Root ignores these permissions, which is why workspaces are never hard-linked when running as root.
+    Directories stay writable, so that new files can still be created next to the cached ones.
+    """
+    write_permissions = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in filenames:
+            file_path = os.path.join(dirpath, filename)
+            os.chmod(file_path, stat.S_IMODE(os.lstat(file_path).st_mode) & ~write_permissions)
+
+def _copy_writable(src: str, dst: str) -> None:
+    """
+    Copies {src} to {dst}, making the copy writable by its owner even though the cached file is read-only.
+    """
+    shutil.copy2(src, dst)
+    os.chmod(dst, stat.S_IMODE(os.lstat(dst).st_mode) | stat.S_IWUSR)
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    Hard-links {src} to {dst}, copying the file instead if they are on different file systems.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        _copy_writable(src, dst)
+
+# Only the workspaces of these languages are hard links to the cache, since their tooling is known not to rewrite files
+# of the repository in place. Others, like Rust and Java (cargo updates Cargo.lock, and JDT.LS regenerates .classpath
+# and .project), get copies of the cache, as does any language until it is added here.
+_LANGUAGES_LINKING_SOURCES = {Language.PYTHON, Language.TYPESCRIPT, Language.JAVASCRIPT, Language.CSHARP}
+
+def _download_test_repository(params: dict, logger: MultilspyLogger, temp_extract_directory: str) -> str:
+    """
+    Makes the sources of the repository given by the parameters available in {temp_extract_directory} and returns
+    the path to them. For the languages in _LANGUAGES_LINKING_SOURCES, the files are hard-linked from the test repository
+    cache, and are read-only so that the cache cannot be modified through them. Otherwise, and when running as root,
+    whom the read-only permission does not stop, the files are writable copies instead.
+    """
+    cached_source_directory = _get_cached_test_repository(params, logger)
+    os.makedirs(temp_extract_directory, exist_ok=False)
+    source_directory_path = str(pathlib.Path(temp_extract_directory, os.path.basename(cached_source_directory)))
+    # Hard links cannot cross file systems, so in that case every file is copied without first trying to link it.
+    # Read-only files cannot be deleted on Windows, so the workspace is always a writable copy there.
+    if (
+        os.name != "nt"
+        and os.geteuid() != 0
+        and Language(params["code_language"]) in _LANGUAGES_LINKING_SOURCES
+        and os.stat(cached_source_directory).st_dev == os.stat(temp_extract_directory).st_dev
+    ):
+        copy_function = _link_or_copy
+    else:
+        copy_function = _copy_writable
+    shutil.copytree(cached_source_directory, source_directory_path, copy_function=copy_function)
+    return source_directory_path
+
+def _remove_directory(directory: str) -> None:
+    """
+    Removes the given directory, if it exists.
+    """
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+
+def _new_temp_extract_directory() -> str:
+    """
+    Returns a fresh path to extract a test repository into. The path is under the multilspy home directory, unless
+    another parent directory is given with the MULTILSPY_TEST_TMPDIR environment variable.
+    """
+    default_parent_directory = str(pathlib.Path(os.path.expanduser("~"), ".multilspy"))
+    parent_directory = os.path.expanduser(os.environ.get("MULTILSPY_TEST_TMPDIR", default_parent_directory))
+    return str(pathlib.Path(parent_directory, uuid4().hex))
+
 @contextlib.contextmanager
 def create_test_context(params: dict) -> Iterator[MultilspyContext]:
     """
@@ -18,19 +200,57 @@ def create_test_context(params: dict) -> Iterator[MultilspyContext]:
     config = MultilspyConfig.from_dict(params)
     logger = MultilspyLogger()
 
-    user_home_dir = os.path.expanduser("~")
-    multilspy_home_directory = str(pathlib.Path(user_home_dir, ".multilspy"))
-    temp_extract_directory = str(pathlib.Path(multilspy_home_directory, uuid4().hex))
+    temp_extract_directory = _new_temp_extract_directory()
     try:
-        os.makedirs(temp_extract_directory, exist_ok=False)
-        assert params['repo_url'].endswith('/')
-        repo_zip_url = params['repo_url'] + f"archive/{params['repo_commit']}.zip"
-        FileUtils.download_and_extract_archive(logger, repo_zip_url, temp_extract_directory, "zip")
-        dir_contents = os.listdir(temp_extract_directory)
-        assert len(dir_contents) == 1
-        source_directory_path = str(pathlib.Path(temp_extract_directory, dir_contents[0]))
+        source_directory_path = _download_test_repository(params, logger, temp_extract_directory)
 
         yield MultilspyContext(config, logger, source_directory_path)
     finally:
-        if os.path.exists(temp_extract_directory):
-            shutil.rmtree(temp_extract_directory)
+        _remove_directory(temp_extract_directory)
+
+@contextlib.asynccontextmanager
+async def create_async_test_context(params: dict) -> AsyncIterator[MultilspyContext]:
+    """
+    Creates a test context for the given parameters, for use with async with.
+
+    The repository is downloaded and removed in a worker thread, so that the event loop is not blocked meanwhile.
+    """
+    config = MultilspyConfig.from_dict(params)
+    logger = MultilspyLogger()
+    loop = asyncio.get_running_loop()
+
+    temp_extract_directory = _new_temp_extract_directory()
+    try:
+        source_directory_path = await loop.run_in_executor(
+            None, _download_test_repository, params, logger, temp_extract_directory
+        )
+
+        yield MultilspyContext(config, logger, source_directory_path)
+    finally:
+        await loop.run_in_executor(None, _remove_directory, temp_extract_directory)
+
+def project_locations(locations: List[dict]) -> List[dict]:
+    """
+    Returns the relative path and range of each of the given LSP locations, which are the parts of the locations that
+    the tests compare. The "uri" and "absolutePath" depend on where the repository is extracted.
+    """
+    return [{"relativePath": location["relativePath"], "range": location["range"]} for location in locations]
+
+def _location_sort_key(location: dict) -> tuple:
+    """
+    Sort key for an LSP location, made of its relative path and range
+    """
+    return (
+        location["relativePath"],
+        location["range"]["start"]["line"],
+        location["range"]["start"]["character"],
+        location["range"]["end"]["line"],
+        location["range"]["end"]["character"],
+    )
+
+def assert_same_items(actual: List[dict], expected: List[dict]) -> None:
+    """
+    Asserts that the locations in {actual} and {expected} are equal regardless of their order, for responses like
+    references, whose order is not specified by the LSP.
+    """
+    assert sorted(actual, key=_location_sort_key) == sorted(expected, key=_location_sort_key)